@@ -3,6 +3,9 @@ import warnings
 from collections import namedtuple
 from .const import Bound, inf
 
+# Infinities are singletons, so bounds can be checked by identity
+_ninf = -inf
+
 
 Atomic = namedtuple("Atomic", ["left", "lower", "upper", "right"])
 
@@ -54,26 +57,17 @@ class Interval:
             # Sort intervals by lower bound, closed first.
             self._intervals.sort(key=lambda i: (i.lower, i.left is Bound.OPEN))
 
-            i = 0
-            # Try to merge consecutive intervals
-            while i < len(self._intervals) - 1:
-                current = self._intervals[i]
-                successor = self._intervals[i + 1]
+            # Merge consecutive intervals in a single pass
+            intervals = iter(self._intervals)
+            merged = [next(intervals)]
+            for successor in intervals:
+                current = merged[-1]
 
                 if self.__class__._mergeable(current, successor):
-                    if current.lower == successor.lower:
-                        lower = current.lower
-                        left = (
-                            current.left
-                            if current.left == Bound.CLOSED
-                            else successor.left
-                        )
-
-                    else:
-                        lower = min(current.lower, successor.lower)
-                        left = (
-                            current.left if lower == current.lower else successor.left
-                        )
+                    # Sort order ensures current has the lowest lower bound,
+                    # and is closed whenever successor shares it and is closed.
+                    lower = current.lower
+                    left = current.left
 
                     if current.upper == successor.upper:
                         upper = current.upper
@@ -88,12 +82,11 @@ class Interval:
                             current.right if upper == current.upper else successor.right
                         )
 
-                    union = Atomic(left, lower, upper, right)
-                    self._intervals.pop(i)  # pop current
-                    self._intervals.pop(i)  # pop successor
-                    self._intervals.insert(i, union)
+                    merged[-1] = Atomic(left, lower, upper, right)
                 else:
-                    i = i + 1
+                    merged.append(successor)
+
+            self._intervals = merged
 
     @classmethod
     def from_atomic(cls, left, lower, upper, right):
@@ -105,8 +98,8 @@ class Interval:
         :param upper: value of the upper bound.
         :param right: either CLOSED or OPEN.
         """
-        left = left if lower not in [inf, -inf] else Bound.OPEN
-        right = right if upper not in [inf, -inf] else Bound.OPEN
+        left = left if lower is not inf and lower is not _ninf else Bound.OPEN
+        right = right if upper is not inf and upper is not _ninf else Bound.OPEN
 
         instance = cls()
         # Check for non-emptiness (otherwise keep instance._intervals = [])
@@ -116,6 +109,19 @@ class Interval:
             instance._intervals = [Atomic(left, lower, upper, right)]
         return instance
 
+    @classmethod
+    def _from_atoms(cls, atoms):
+        """
+        Create an Interval instance from a list of atomic intervals that are
+        already sorted, disjoint and not mergeable. No check is performed.
+
+        :param atoms: a list of atomic intervals.
+        :return: an Interval instance.
+        """
+        instance = cls()
+        instance._intervals = atoms
+        return instance
+
     @classmethod
     def _mergeable(cls, a, b):
         """
@@ -136,6 +142,25 @@ class Interval:
 
         return first.upper > second.lower
 
+    def _locate(self, value, start=0):
+        """
+        Return the index of the last atomic interval whose lower bound is lower
+        than or equal to given value, or start - 1 if there is no such interval
+        from index start.
+
+        :param value: an arbitrary comparable value.
+        :param start: index from which to search (default is 0).
+        :return: an index.
+        """
+        low, high = start, len(self._intervals)
+        while low < high:
+            middle = (low + high) // 2
+            if value < self._intervals[middle].lower:
+                high = middle
+            else:
+                low = middle + 1
+        return low - 1
+
     @property
     def left(self):
         """
@@ -227,7 +252,7 @@ class Interval:
             left = enclosure.left if left is None else left
 
         if callable(lower):
-            if ignore_inf and enclosure.lower in [-inf, inf]:
+            if ignore_inf and (enclosure.lower is inf or enclosure.lower is _ninf):
                 lower = enclosure.lower
             else:
                 lower = lower(enclosure.lower)
@@ -235,7 +260,7 @@ class Interval:
             lower = enclosure.lower if lower is None else lower
 
         if callable(upper):
-            if ignore_inf and enclosure.upper in [-inf, inf]:
+            if ignore_inf and (enclosure.upper is inf or enclosure.upper is _ninf):
                 upper = enclosure.upper
             else:
                 upper = upper(enclosure.upper)
@@ -396,15 +421,18 @@ class Interval:
         return len(self._intervals)
 
     def __iter__(self):
-        yield from (self.__class__.from_atomic(*i) for i in self._intervals)
+        for i in self._intervals:
+            yield self.__class__._from_atoms([i])
 
     def __getitem__(self, item):
         if isinstance(item, slice):
-            return self.__class__(
-                *[self.__class__.from_atomic(*i) for i in self._intervals[item]]
-            )
+            # A subset of sorted and disjoint atoms is sorted and disjoint
+            atoms = self._intervals[item]
+            if item.step is not None and item.step < 0:
+                atoms.reverse()
+            return self.__class__._from_atoms(atoms)
         else:
-            return self.__class__.from_atomic(*self._intervals[item])
+            return self.__class__._from_atoms([self._intervals[item]])
 
     def __and__(self, other):
         if not isinstance(other, Interval):
@@ -481,18 +509,12 @@ class Interval:
                 )
                 return left and right
             else:
-                selfiter = iter(self)
-                current = next(selfiter)
-
+                # Only the last atomic interval starting before other can contain
+                # it. As item is sorted, each search resumes from the previous one.
+                index = 0
                 for other in item:
-                    while current < other:
-                        try:
-                            current = next(selfiter)
-                        except StopIteration:
-                            return False
-
-                    # here current and other could have an overlap
-                    if other not in current:
+                    index = self._locate(other.lower, index)
+                    if index < 0 or other not in self[index]:
                         return False
                 return True
         else:
@@ -500,14 +522,15 @@ class Interval:
             if self.upper < item or self.lower > item:
                 return False
 
-            for i in self._intervals:
-                left = (item >= i.lower) if i.left == Bound.CLOSED else (item > i.lower)
-                right = (
-                    (item <= i.upper) if i.right == Bound.CLOSED else (item < i.upper)
-                )
-                if left and right:
-                    return True
-            return False
+            # Only the last atomic interval starting before item can contain it
+            index = self._locate(item)
+            if index < 0:
+                return False
+
+            i = self._intervals[index]
+            left = (item >= i.lower) if i.left == Bound.CLOSED else (item > i.lower)
+            right = (item <= i.upper) if i.right == Bound.CLOSED else (item < i.upper)
+            return left and right
 
     def __invert__(self):
         complements = [
@@ -523,26 +546,72 @@ class Interval:
         return self.__class__(*complements)
 
     def __sub__(self, other):
-        if isinstance(other, Interval):
-            return self & ~other
-        else:
+        if not isinstance(other, Interval):
             return NotImplemented
 
+        differences = []
+        o_intervals = other._intervals
+        j = 0
+
+        for current in self._intervals:
+            remainder = current
+
+            while j < len(o_intervals):
+                o_current = o_intervals[j]
+
+                if o_current.upper < remainder.lower or (
+                    o_current.upper == remainder.lower
+                    and (o_current.right == Bound.OPEN or remainder.left == Bound.OPEN)
+                ):
+                    # o_current is before remainder, and thus before next ones
+                    j = j + 1
+                elif o_current.lower > remainder.upper or (
+                    o_current.lower == remainder.upper
+                    and (o_current.left == Bound.OPEN or remainder.right == Bound.OPEN)
+                ):
+                    # o_current is after remainder
+                    break
+                else:
+                    # Keep what precedes o_current, and go on with what follows
+                    differences.extend(
+                        self.__class__.from_atomic(
+                            remainder.left,
+                            remainder.lower,
+                            o_current.lower,
+                            ~o_current.left,
+                        )._intervals
+                    )
+
+                    if o_current.upper > remainder.upper or (
+                        o_current.upper == remainder.upper
+                        and (
+                            o_current.right == Bound.CLOSED
+                            or remainder.right == Bound.OPEN
+                        )
+                    ):
+                        # o_current covers remainder, and can overlap next ones
+                        remainder = None
+                        break
+
+                    remainder = Atomic(
+                        ~o_current.right,
+                        o_current.upper,
+                        remainder.upper,
+                        remainder.right,
+                    )
+                    j = j + 1
+
+            if remainder is current:
+                differences.append(current)
+            elif remainder is not None:
+                differences.extend(self.__class__.from_atomic(*remainder)._intervals)
+
+        return self.__class__._from_atoms(differences)
+
     def __eq__(self, other):
         if isinstance(other, Interval):
-            if len(other._intervals) != len(self._intervals):
-                return False
-
-            for a, b in zip(self._intervals, other._intervals):
-                eq = (
-                    a.left == b.left
-                    and a.lower == b.lower
-                    and a.upper == b.upper
-                    and a.right == b.right
-                )
-                if not eq:
-                    return False
-            return True
+            # Atomic intervals are compared field by field
+            return self._intervals == other._intervals
         else:
             return NotImplemented
 
@@ -615,7 +684,7 @@ class Interval:
             return not self.empty and self.lower >= other
 
     def __hash__(self):
-        return hash(tuple([self.lower, self.upper]))
+        return hash((self.lower, self.upper))
 
     def __repr__(self):
         if self.empty:
@@ -676,11 +745,11 @@ class AbstractDiscreteInterval(Interval):
 
     @classmethod
     def from_atomic(cls, left, lower, upper, right):
-        if left == Bound.OPEN and lower not in [-inf, inf]:
+        if left == Bound.OPEN and lower is not inf and lower is not _ninf:
             left = Bound.CLOSED
             lower = cls._incr(lower)
 
-        if right == Bound.OPEN and upper not in [-inf, inf]:
+        if right == Bound.OPEN and upper is not inf and upper is not _ninf:
             right = Bound.CLOSED
             upper = cls._decr(upper)
 